@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+# Make the backend package importable when running this script from any directory.
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from sqlalchemy import inspect
+
+from src.db.database import engine, Base
+# Import the models so their tables and indexes are registered on Base.metadata
+from src.db.models import db_user, db_course, db_file, db_note, db_usage, db_chat  # noqa: F401
+
+# The app creates tables with Base.metadata.create_all, which skips tables that
+# already exist, so indexes added to a model later (e.g. ix_usage_user_id_action
+# on usages) never reach an existing database.
+# Running this script creates every index declared on the models that is missing.
+#
+# The equivalent SQL for the indexes added so far:
+#   CREATE INDEX ix_usage_user_id_action ON usages (user_id, action);
+
+
+def create_missing_indexes() -> int:
+    """
+    Create all indexes declared on the models that do not exist in the database yet.
+
+    Returns:
+        The number of indexes created.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = 0
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            # create_all will create the table together with its indexes
+            continue
+
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            print(f"Creating index '{index.name}' on '{table.name}'...")
+            index.create(bind=engine)
+            created += 1
+
+    return created
+
+
+if __name__ == "__main__":
+    try:
+        count = create_missing_indexes()
+    except Exception as e:
+        print(f"An error occurred while creating indexes: {e}")
+        sys.exit(1)
+
+    print(f"Done. Created {count} missing index(es).")
+    sys.exit(0)
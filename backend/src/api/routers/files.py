@@ -140,7 +140,8 @@ async def get_course_documents(
 ):
     """Get all documents belonging to the given course and current user."""
     documents = (
-        db.query(Document)
+        # Select only the info columns so the file blobs are not loaded
+        db.query(Document.id, Document.filename, Document.content_type, Document.created_at)
         .filter(Document.user_id == current_user.id)
         .filter(Document.course_id == course_id)
         .offset(skip)
@@ -307,7 +308,8 @@ async def get_course_images(
 ):
     """Get all images belonging to the given course and current user."""
     images = (
-        db.query(Image)
+        # Select only the info columns so the file blobs are not loaded
+        db.query(Image.id, Image.filename, Image.content_type, Image.created_at)
         .filter(Image.user_id == current_user.id)
         .filter(Image.course_id == course_id)
         .offset(skip)
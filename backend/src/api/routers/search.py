@@ -18,7 +18,7 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=List[SearchResult])
-async def search(
+def search(
     query: str,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -34,7 +34,7 @@ async def search(
         )
     
     try:
-        results = await search_courses_and_chapters(db=db, query=query, user_id=str(current_user.id))
+        results = search_courses_and_chapters(db=db, query=query, user_id=str(current_user.id))
         return results
     except Exception as e:
 
@@ -1,11 +1,27 @@
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy import and_
 from sqlalchemy import text
 from ..models.db_course import Chapter, Course
 
 
+# Built once at import; the statement is identical for every full-text search
+_SEARCH_CHAPTERS_INDEXED_STMT = text("""
+    SELECT 
+        chapters.id, chapters.course_id, chapters.index, 
+        chapters.caption, chapters.summary, chapters.content, 
+        chapters.time_minutes, chapters.is_completed, 
+        chapters.created_at, chapters.image_url
+    FROM chapters
+    JOIN courses ON courses.id = chapters.course_id
+    WHERE courses.user_id = :user_id
+    AND MATCH(chapters.caption, chapters.summary, chapters.content)
+        AGAINST (:query IN NATURAL LANGUAGE MODE)
+    LIMIT :limit
+""")
+
+
 
 
 
@@ -111,6 +127,7 @@ def search_chapters_no_content(db: Session, query: str, user_id: str, limit: int
     return (
         db.query(Chapter)
         .join(Chapter.course)  # Join with Course for access control
+        .options(contains_eager(Chapter.course))  # Reuse the join so chapter.course needs no extra query
         .filter(
             (Course.user_id == user_id)
         )
@@ -135,21 +152,7 @@ def search_chapters_indexed(db: Session, query: str, user_id: str, limit: int =
         List of matching Chapter objects
     """
 
-    stmt = text("""
-        SELECT 
-            chapters.id, chapters.course_id, chapters.index, 
-            chapters.caption, chapters.summary, chapters.content, 
-            chapters.time_minutes, chapters.is_completed, 
-            chapters.created_at, chapters.image_url
-        FROM chapters
-        JOIN courses ON courses.id = chapters.course_id
-        WHERE courses.user_id = :user_id
-        AND MATCH(chapters.caption, chapters.summary, chapters.content)
-            AGAINST (:query IN NATURAL LANGUAGE MODE)
-        LIMIT :limit
-    """)
-
-    results = db.execute(stmt, {"user_id": user_id, "query": query, "limit": limit})
+    results = db.execute(_SEARCH_CHAPTERS_INDEXED_STMT, {"user_id": user_id, "query": query, "limit": limit})
     return [Chapter(**row._asdict()) for row in results]
 
 
@@ -1,7 +1,8 @@
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.db_course import Course, CourseStatus, Chapter
+from ..models.db_user import User
 from typing import List
 from ..models.db_course import Course, Chapter
 from sqlalchemy.orm import Session
@@ -9,6 +10,19 @@ from sqlalchemy.sql import select, func as sql_func
 from ...api.schemas.course import CourseInfo
 
 
+# Course columns needed to build a CourseInfo; shared by the course info queries
+_COURSE_INFO_COLUMNS = (
+    Course.id,
+    Course.total_time_hours,
+    Course.status,
+    Course.title,
+    Course.description,
+    Course.chapter_count,
+    Course.image_url,
+    Course.is_public,
+    Course.created_at,
+)
+
 
 ############### COURSES
 def get_course_by_id(db: Session, course_id: int) -> Optional[Course]:
@@ -114,10 +128,13 @@ def get_public_courses_infos(db: Session, user_id: str, skip: int = 0, limit: in
         List of CourseInfo objects containing course info with completed chapter count
     """
     
-    # Eagerly load the related User object to get the username efficiently
+    # Select only the columns CourseInfo needs, joining User just for the username
     courses = (
-        db.query(Course)
-        .options(joinedload(Course.user))
+        db.query(
+            *_COURSE_INFO_COLUMNS,
+            User.username,
+        )
+        .outerjoin(User, Course.user_id == User.id)
         .filter(Course.is_public == True)
         .order_by(Course.created_at.desc())
         .offset(skip)
@@ -137,7 +154,7 @@ def get_public_courses_infos(db: Session, user_id: str, skip: int = 0, limit: in
             chapter_count=course.chapter_count,
             image_url=course.image_url,
             completed_chapter_count=0, # This can be calculated if needed
-            user_name=course.user.username if course.user else None,
+            user_name=course.username,
             is_public=course.is_public,
             created_at=course.created_at,
         )
@@ -169,9 +186,9 @@ def get_courses_infos(db: Session, user_id: str, skip: int = 0, limit: int = 200
         .subquery()
     )
     
-    # Main query joining with the subquery
+    # Main query joining with the subquery, selecting only the columns CourseInfo needs
     courses = (db.query(
-            Course,
+            *_COURSE_INFO_COLUMNS,
             sql_func.coalesce(completed_chapters_subq.c.completed_count, 0).label('completed_chapters')
         )
         .outerjoin(
@@ -186,7 +203,7 @@ def get_courses_infos(db: Session, user_id: str, skip: int = 0, limit: int = 200
     
     # Convert to list of CourseInfo objects
     result = []
-    for course, completed_chapters in courses:
+    for course in courses:
         course_info = CourseInfo(
             course_id=course.id,
             total_time_hours=course.total_time_hours,
@@ -195,7 +212,7 @@ def get_courses_infos(db: Session, user_id: str, skip: int = 0, limit: int = 200
             description=course.description,
             chapter_count=course.chapter_count,
             image_url=course.image_url,
-            completed_chapter_count=completed_chapters,
+            completed_chapter_count=course.completed_chapters,
             is_public=course.is_public,
             created_at=course.created_at,
         )
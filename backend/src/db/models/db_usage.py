@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime # Added Text and DateTime
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Index # Added Text and DateTime
 from datetime import datetime, timezone
 from ..database import Base
 from sqlalchemy.dialects.mysql import LONGTEXT
@@ -16,4 +16,9 @@ class Usage(Base):
     chapter_id = Column(Integer, nullable=True)  # Nullable for global actions not tied to a specific chapter
     action = Column(String(50), nullable=False)  # e.g., "view", "complete", "start", "create", "delete"
     details = Column(Text, nullable=True)  # Additional details about the action
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
\ No newline at end of file
+    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    # Every usage lookup filters by user and action (login, chat, create_course, ...).
+    __table_args__ = (
+        Index('ix_usage_user_id_action', 'user_id', 'action'),
+    )
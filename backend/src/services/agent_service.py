@@ -65,7 +65,7 @@ class AgentService:
 
         # define Rag service
         self.vector_service = vector_service.VectorService()
-        self.contentService = CourseContentService()
+        self.contentService = CourseContentService(self.vector_service)
 
 
     @staticmethod
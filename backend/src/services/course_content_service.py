@@ -1,5 +1,5 @@
 # backend/src/services/course_content_service.py
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from .data_processors.pdf_processor import PDFProcessor
 from .vector_service import VectorService
@@ -9,9 +9,10 @@ import logging
 
 
 class CourseContentService:
-    def __init__(self):
+    def __init__(self, vector_service: Optional[VectorService] = None):
         self.pdf_processor = PDFProcessor()
-        self.vector_service = VectorService()
+        # Reuse the caller's VectorService so the embedding model is only loaded once
+        self.vector_service = vector_service or VectorService()
         self.logger = logging.getLogger(__name__)
 
     def get_rag_infos(self, course_id: int, topic: dict[str, str]):
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import uuid
 import os
 import tempfile
@@ -286,8 +287,8 @@ class FlashcardService:
         """Get user's processing history."""
         # In a real implementation, this would query a database
         # For now, return recent tasks from memory
-        tasks = list(self.task_manager.tasks.values())
-        tasks.sort(key=lambda x: x.task_id, reverse=True)  # Sort by creation time (task_id is UUID)
+        # Tasks are stored in creation order (task_id is a random UUID), so walk them newest first
+        tasks = itertools.islice(reversed(self.task_manager.tasks.values()), limit)
         return [{
             "task_id": task.task_id,
             "status": task.status.value,
@@ -296,14 +297,20 @@ class FlashcardService:
             "completed_steps": task.completed_steps,
             "error_message": task.error_message,
             "download_url": task.download_url
-        } for task in tasks[:limit]]
+        } for task in tasks]
 
     def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """Get processing statistics for the user."""
-        tasks = list(self.task_manager.tasks.values())
+        tasks = self.task_manager.tasks.values()
         total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-        failed_tasks = len([t for t in tasks if t.status == TaskStatus.FAILED])
+        completed_tasks = 0
+        failed_tasks = 0
+        # Count both statuses in a single pass over the tasks
+        for task in tasks:
+            if task.status == TaskStatus.COMPLETED:
+                completed_tasks += 1
+            elif task.status == TaskStatus.FAILED:
+                failed_tasks += 1
 
         return {
             "total_tasks": total_tasks,
@@ -11,7 +11,7 @@ from ..api.schemas.search import SearchResult
 from ..db.crud import usage_crud
 
 
-async def search_courses_and_chapters(
+def search_courses_and_chapters(
     db: Session,
     query: str,
     user_id: str,
@@ -92,10 +92,11 @@ async def search_courses_and_chapters(
     
     # Combine and sort results (simple ranking by match in title first, then description)
     results = course_results + chapter_results
+    query_lower = query.lower()
     
     def sort_key(result: SearchResult) -> int:
         # Prioritize title matches over description matches
-        title_match = query.lower() in (result.title or "").lower()
+        title_match = query_lower in (result.title or "").lower()
         return 0 if title_match else 1
     
     results.sort(key=sort_key)